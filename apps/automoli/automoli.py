@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from copy import deepcopy
 from datetime import datetime, date, time, timedelta
 from dateutil import tz
@@ -14,6 +14,8 @@ from enum import Enum, IntEnum
 from inspect import stack
 import logging
 from pprint import pformat
+import re
+from time import monotonic
 from typing import Any
 
 # pylint: disable=import-error
@@ -52,11 +54,37 @@ EVENT_MOTION_XIAOMI = "xiaomi_aqara.motion"
 EVENT_AUTOMOLI_STATS = "automoli_stats"
 
 RANDOMIZE_SEC = 5
+# seconds an illuminance verdict is reused before the sensors are read again
+ILLUMINANCE_CACHE_SEC = 5
 SECONDS_PER_MIN: int = 60
 DATETIME_FORMAT = "%I:%M:%S%p %Y-%m-%d"
-TIME_FORMAT = "%H:%M:%S"
+ZERO_TIME = "00:00:00"
+LOCAL_TIMEZONE = tz.tzlocal()
 
-NOT_READY_STATES = {"unavailable", "unknown", "none"}
+# last motion attributes of the room stats entity
+MOTION_ATTRS = ("last_motion_detected", "last_motion_cleared", "last_motion_by")
+
+# daily counters kept as attributes of the room stats entity
+COUNTER_ATTRS = (
+    "times_turned_on_by_automoli",
+    "times_turned_off_by_automoli",
+    "times_turned_on_by_automations",
+    "times_turned_off_by_automations",
+    "times_turned_on_manually",
+    "times_turned_off_manually",
+)
+
+# light settings that are activated instead of switching lights
+SCENE_SCRIPT_PREFIXES = ("scene.", "script.")
+
+NOT_READY_STATES = frozenset({"unavailable", "unknown", "none"})
+
+# "internal keys" not shown when displaying the config
+HIDDEN_CONFIG_KEYS = frozenset({"module", "class"})
+
+# umlaut replacements used when matching room names against entities
+UMLAUTS_SINGLE = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "s"})
+UMLAUTS_DOUBLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
 
 
 class EntityType(Enum):
@@ -135,6 +163,14 @@ install_pip_package("adutils", version=">=0.6.2")
 from adutils import Room, hl, natural_time, py38_or_higher, py39_or_higher  # noqa
 from adutils import py37_or_higher  # noqa
 
+# matches the ANSI codes adutils uses to highlight text
+ANSI_ESCAPE = re.compile(r"\033\[[0-9;]*m")
+
+
+def plain_natural_time(seconds: int | str) -> str:
+    """natural_time without highlighting, e.g. for room statistics attributes"""
+    return ANSI_ESCAPE.sub("", natural_time(int(seconds)))
+
 
 class DimMethod(IntEnum):
     """IntEnum representing the transition-to-off method used."""
@@ -179,7 +215,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 # "easier to ask for forgiveness than permission"
                 # https://stackoverflow.com/a/610923/13180763
                 try:
-                    ha_name = self.room.name.replace("_", " ").title()
+                    ha_name = self._room_pretty
                 except AttributeError:
                     ha_name = APP_NAME
                     self.lg(
@@ -261,6 +297,18 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         self.icon = APP_ICON
 
+        # getting function references once for small performance gain in the
+        # frequently called motion and timer handlers
+        self._get_state = self.get_state
+        self._run_in = self.run_in
+        self._lg = self.lg
+        self._timer_running = self.timer_running
+        self._cancel_timer = self.cancel_timer
+
+        # friendly names by entity id, kept current by a listener per cached entity
+        self._name_cache: dict[str, str] = {}
+        self._name_handles: dict[str, str] = {}
+
         # get a real dict for the configuration
         self.args: dict[str, Any] = dict(self.args)
 
@@ -309,6 +357,9 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.room_name = (
             str(self.args.pop("room")) if "room" in self.args else self.name
         )
+        # pretty room name used in log messages, the room name never changes at runtime
+        self._room_pretty = self.room_name.replace("_", " ").title()
+        self._room_pretty_hl = hl(self._room_pretty)
 
         # general delay
         self.delay = int(self.getarg("delay", DEFAULT_DELAY))
@@ -326,6 +377,11 @@ class AutoMoLi(hass.Hass):  # type: ignore
             "motion_on": self.getarg("motion_state_on", None),
             "motion_off": self.getarg("motion_state_off", None),
         }
+        # states in which a motion sensor is considered cleared, including when it
+        # went from "on" to a not ready state
+        self._clear_states: frozenset[str] = frozenset(
+            NOT_READY_STATES | {self.states["motion_off"]}
+        )
 
         # threshold values
         self.thresholds = {
@@ -366,7 +422,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
             self.night_mode = self.configure_night_mode(night_mode)
 
         # on/off switch via input.boolean
-        self.disable_switch_entities: list[str] = list(
+        self.disable_switch_entities: tuple[str, ...] = tuple(
             self.listr(self.getarg("disable_switch_entities", set()))
         )
         self.disable_switch_states: set[str] = self.listr(
@@ -374,13 +430,13 @@ class AutoMoLi(hass.Hass):  # type: ignore
         )
 
         # additional sensors that will block turning on or off lights
-        self.block_on_switch_entities: list[str] = list(
+        self.block_on_switch_entities: tuple[str, ...] = tuple(
             self.listr(self.getarg("block_on_switch_entities", set()))
         )
         self.block_on_switch_states: set[str] = self.listr(
             self.getarg("block_on_switch_states", set(["off"])), False
         )
-        self.block_off_switch_entities: list[str] = list(
+        self.block_off_switch_entities: tuple[str, ...] = tuple(
             self.listr(self.getarg("block_off_switch_entities", set()))
         )
         self.block_off_switch_states: set[str] = self.listr(
@@ -406,6 +462,11 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.only_own_events: bool = self.getarg("only_own_events", None)
         self._switched_on_by_automoli: set[str] = set()
         self._switched_off_by_automoli: set[str] = set()
+        # lookup from a new light state to the entities automoli switched to that state
+        self._switched_by_automoli: dict[str, set[str]] = {
+            "on": self._switched_on_by_automoli,
+            "off": self._switched_off_by_automoli,
+        }
         # Cooldown period is used when a light is turned off manually, to ensure automoli
         # doesn't immediately turn it back on
         self.cooldown_period: int = int(self.getarg("cooldown", DEFAULT_COOLDOWN))
@@ -429,21 +490,24 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # currently active daytime settings
         self.active: dict[str, int | str] = {}
 
+        # last illuminance check as (monotonic time, already bright enough)
+        self._illuminance_cache: tuple[float, bool] | None = None
+
         # entity lists for initial discovery
         states = self.get_state()
 
         # define light entities switched by automoli
-        self.lights: list[str] = list(self.listr(self.getarg("lights", set())))
+        lights: list[str] = list(self.listr(self.getarg("lights", set())))
 
         # warn and remove scenes and scripts from lights and recommend using after_on or after_off
         scene_or_script_found = False
         remove_list = set()
-        for light in self.lights:
-            if light.startswith("scene.") or light.startswith("script."):
+        for light in lights:
+            if light.startswith(SCENE_SCRIPT_PREFIXES):
                 scene_or_script_found = True
                 remove_list.add(light)
         for light in remove_list:
-            self.lights.remove(light)
+            lights.remove(light)
         if scene_or_script_found:
             self.lg(
                 f"A scene or script was found in the list of lights and removed",
@@ -454,15 +518,22 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 icon=ALERT_ICON,
             )
 
-        if not self.lights:
+        if not lights:
             room_light_group = f"light.{self.room_name}"
             if self.entity_exists(room_light_group):
-                self.lights.add(room_light_group)
+                lights.append(room_light_group)
             else:
-                self.lights.update(
+                lights.extend(
                     self.find_sensors(EntityType.LIGHT.prefix, self.room_name, states)
                 )
 
+        # only iterated from here on, so store as a tuple
+        self.lights: tuple[str, ...] = tuple(lights)
+        # whether each entity is in the light domain and so supports brightness
+        self._light_domains: dict[str, bool] = {
+            light: light.startswith("light.") for light in self.lights
+        }
+
         # define a set of entities that will be switched on after lights are turned on / off
         self.after_on: set[str] = self.listr(self.getarg("after_on", set()))
         self.after_off: set[str] = self.listr(self.getarg("after_off", set()))
@@ -471,10 +542,12 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.sensors: dict[str, Any] = {}
 
         # enumerate sensors for motion detection
-        self.sensors[EntityType.MOTION.idx] = self.listr(
-            self.getarg(
-                "motion",
-                self.find_sensors(EntityType.MOTION.prefix, self.room_name, states),
+        self.sensors[EntityType.MOTION.idx] = tuple(
+            self.listr(
+                self.getarg(
+                    "motion",
+                    self.find_sensors(EntityType.MOTION.prefix, self.room_name, states),
+                )
             )
         )
 
@@ -514,7 +587,27 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.sensor_state: str = "off"
         self.sensor_onToday: int = 0
         self.sensor_attr: dict[str, Any] = {}
+        # parsed form of sensor_attr["last_turned_on"], so it need not be parsed again
+        self._last_turned_on: datetime | None = None
+        # last state and attributes written to the stats entity
+        self._written_stats: tuple[str, dict[str, Any]] | None = None
         self.sensor_update_handle: str | None = None
+        # pending blocker stats updates by stat, so repeated checks replace each other
+        self._stats_handles: dict[str, str] = {}
+        # update_room_stats handlers by stat
+        self._stat_handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "motion": self._stat_motion,
+            "motion_cleared": self._stat_motion_cleared,
+            "lastOn": self._stat_last_on,
+            "lastOff": self._stat_last_off,
+            "overrideDelay": self._stat_override_delay,
+            "refreshTimer": self._stat_refresh_timer,
+            "switchDaytime": self._stat_switch_daytime,
+            "blockedOn": self._stat_blocked_on,
+            "blockedOff": self._stat_blocked_off,
+            "disabled": self._stat_disabled,
+            "onlyOwnEventsBlock": self._stat_only_own_events_block,
+        }
         self.init_room_stats()
         self.run_daily(self.reset_room_stats, "00:00:00")
         self.listen_event(self.room_event, event=EVENT_AUTOMOLI_STATS)
@@ -526,9 +619,10 @@ class AutoMoLi(hass.Hass):  # type: ignore
         for sensor_type in SENSORS_OPTIONAL:
 
             if sensor_type in self.thresholds and self.thresholds[sensor_type]:
-                self.sensors[sensor_type] = self.listr(
-                    self.getarg(sensor_type, None)
-                ) or self.find_sensors(KEYWORDS[sensor_type], self.room_name, states)
+                self.sensors[sensor_type] = tuple(
+                    self.listr(self.getarg(sensor_type, None))
+                    or self.find_sensors(KEYWORDS[sensor_type], self.room_name, states)
+                )
 
                 self.lg(f"{self.sensors[sensor_type] = }", level=logging.DEBUG)
 
@@ -586,7 +680,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         )
         for light in self.lights:
             # do not track scenes or scripts
-            if not light.startswith("scene.") and not light.startswith("script."):
+            if not light.startswith(SCENE_SCRIPT_PREFIXES):
                 listener.add(
                     self.listen_state(
                         self.outside_change_detected,
@@ -673,7 +767,8 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.show_info(self.args)
 
         # set room as "on" if the state of any of the entities in self.lights is "on"
-        if any([self.get_state(light, copy=False) == "on" for light in self.lights]):
+        get_state = self.get_state
+        if any(get_state(light, copy=False) == "on" for light in self.lights):
             self.run_in(
                 self.update_room_stats,
                 0,
@@ -690,7 +785,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
             is_brightness = isinstance(light_setting, int)
             message = (
-                f"{hl(self.room.name.replace('_',' ').title())} was {hl('on')} when AutoMoLi started → "
+                f"{self._room_pretty_hl} was {hl('on')} when AutoMoLi started → "
                 f"{'brightness: ' if is_brightness else ''}{hl(light_setting)}"
                 f"{'%' if is_brightness else ''} | delay: {hl(natural_time(int(self.active['delay'])))}"
             )
@@ -720,6 +815,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         if daytime is not None:
             self.active = daytime
+            self._illuminance_cache = None
             if not kwargs.get("initial"):
 
                 delay = daytime["delay"]
@@ -739,7 +835,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 # when do not want to update (or else could turn on the lights even when
                 # no motion is detected)
                 if self.transition_on_daytime_switch and any(
-                    [self.get_state(light, copy=False) == "on" for light in self.lights]
+                    self.get_state(light, copy=False) == "on" for light in self.lights
                 ):
                     self.lights_on(source="daytime change", force=True)
                     action_done = "activated"
@@ -776,29 +872,36 @@ class AutoMoLi(hass.Hass):  # type: ignore
         if state == old_state:
             return
 
-        # Handle case when motion sensor went from "on" to a not ready state
-        states = set()
-        states.update(NOT_READY_STATES)
-        states.add(self.states["motion_off"])
+        # Fetch the state of every motion sensor once and reuse it for the
+        # debug log and the check that all motion sensors have cleared
+        states = self._clear_states
+        sensors = self.sensors[EntityType.MOTION.idx]
+        sensor_states = [self._get_state(sensor, copy=False) for sensor in sensors]
+        not_clear_sensors = [
+            sensor
+            for sensor, sensor_state in zip(sensors, sensor_states)
+            if sensor_state not in states
+        ]
 
-        self.lg(
-            f"{stack()[0][3]}: states to check: {states} | sensors: {self.sensors[EntityType.MOTION.idx]} | all clear: {all([self.get_state(sensor, copy=False) in states for sensor in self.sensors[EntityType.MOTION.idx]])}",
-            level=logging.DEBUG,
-        )
+        log = logging.DEBUG >= self.loglevel
+
+        if log:
+            self._lg(
+                f"motion_cleared: states to check: {states} | sensors: {sensors} | not clear: {not_clear_sensors}",
+                level=logging.DEBUG,
+            )
 
         # Check that all motion sensors have cleared
-        if all(
-            [
-                self.get_state(sensor, copy=False) in states
-                for sensor in self.sensors[EntityType.MOTION.idx]
-            ]
-        ):
+        if not not_clear_sensors:
             # all motion sensors off, starting timer
-            self.lg(
-                f"{stack()[0][3]}: {entity} changed {attribute} from {old} to {new}",
-                level=logging.DEBUG,
+            if log:
+                self._lg(
+                    f"motion_cleared: {entity} changed {attribute} from {old} to {new}",
+                    level=logging.DEBUG,
+                )
+            self._run_in(
+                self.update_room_stats, 0, stat="motion_cleared", entity=entity
             )
-            self.run_in(self.update_room_stats, 0, stat="motion_cleared", entity=entity)
             self.refresh_timer(refresh_type="motion_cleared")
         else:
             # cancel scheduled callbacks
@@ -816,7 +919,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         log = logging.DEBUG >= self.loglevel
 
         if log:
-            self.lg(
+            self._lg(
                 f"{stack()[0][3]}: {entity} changed {attribute} from {old} to {new}",
                 level=logging.DEBUG,
             )
@@ -825,7 +928,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.clear_handles()
 
         if log:
-            self.lg(
+            self._lg(
                 f"{stack()[0][3]}: handles cleared and cancelled all scheduled timers"
                 f" | {self.dimming = }",
                 level=logging.DEBUG,
@@ -841,10 +944,10 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # Process motion event even if AutoMoLi is currently blocked/disabled
         # is_blocked and is_disabled checked during lights_on and lights_off calls
         motion_trigger = data["entity_id"].replace(EntityType.MOTION.prefix, "")
-        self.run_in(self.update_room_stats, 1, stat="motion", entity=motion_trigger)
+        self._run_in(self.update_room_stats, 1, stat="motion", entity=motion_trigger)
 
         if logging.DEBUG >= self.loglevel:
-            self.lg(
+            self._lg(
                 f"{stack()[0][3]}: received '{hl(event)}' event from "
                 f"'{motion_trigger}' | {self.dimming = }",
                 level=logging.DEBUG,
@@ -852,7 +955,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
             refresh = ""
             if event != "motion_detected":
                 refresh = "and then refresh timer "
-            self.lg(
+            self._lg(
                 f"{stack()[0][3]}: ready to switch on lights {refresh}",
                 level=logging.DEBUG,
             )
@@ -877,10 +980,11 @@ class AutoMoLi(hass.Hass):  # type: ignore
         of a light setup a timer by calling `refresh_timer`
         """
 
-        self.lg(
-            f"{stack()[0][3]}: called for {entity = } with {old = } and {new = }",
-            level=logging.DEBUG,
-        )
+        if logging.DEBUG >= self.loglevel:
+            self.lg(
+                f"{stack()[0][3]}: called for {entity = } with {old = } and {new = }",
+                level=logging.DEBUG,
+            )
 
         # Check if got entire state object
         if attribute == "all":
@@ -889,19 +993,19 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 old_state = dict(old).get("state", "unknown")
             else:
                 old_state = "unknown"
-            context_id = dict(dict(new).get("context")).get("id")
         else:
             state = new
             old_state = old
 
-        # ensure the change wasn't because of automoli
-        if (state == "on" and entity in self._switched_on_by_automoli) or (
-            state == "off" and entity in self._switched_off_by_automoli
-        ):
-            self.lg(
-                f"{stack()[0][3]}: change was due to automoli so ignoring",
-                level=logging.DEBUG,
-            )
+        # ensure the change wasn't because of automoli before doing any other work
+        if (
+            switched := self._switched_by_automoli.get(state)
+        ) is not None and entity in switched:
+            if logging.DEBUG >= self.loglevel:
+                self.lg(
+                    "outside_change_detected: change was due to automoli so ignoring",
+                    level=logging.DEBUG,
+                )
             return
 
         # do not process if current state is in list of not ready states
@@ -911,18 +1015,22 @@ class AutoMoLi(hass.Hass):  # type: ignore
             return
 
         # Determine if state change was caused by an automation
+        # the domain lookup already returns the full state of every automation
+        # so there is no need to fetch each one again, and stop at the first match
         automation_name = ""
         source = ""
-        automations = self.get_state(entity_id="automation")
-        for automation in automations:
-            automation_state = self.get_state(entity_id=automation, attribute="all")
-            automation_context_id = dict(dict(automation_state).get("context")).get(
-                "id"
-            )
-            if context_id == automation_context_id:
-                automation_name = dict(dict(automation_state).get("attributes")).get(
-                    "friendly_name"
-                )
+        context_id = (
+            dict(dict(new).get("context")).get("id") if attribute == "all" else None
+        )
+        if context_id:
+            automations = self.get_state(entity_id="automation", copy=False)
+            for automation_state in automations.values():
+                automation_state = dict(automation_state)
+                if context_id == dict(automation_state.get("context")).get("id"):
+                    automation_name = dict(automation_state.get("attributes")).get(
+                        "friendly_name"
+                    )
+                    break
         if automation_name == "":
             if old_state == "on" or old_state == "off":
                 self.lg(f"{hl(self.get_name(entity))} was turned '{state}' manually")
@@ -939,30 +1047,25 @@ class AutoMoLi(hass.Hass):  # type: ignore
             source = automation_name
 
         # stop tracking the light as turned on or off by AutoMoLi
-        if entity in self._switched_on_by_automoli:
-            self._switched_on_by_automoli.remove(entity)
-        if entity in self._switched_off_by_automoli:
-            self._switched_off_by_automoli.remove(entity)
-
-        # Get all of the lights in the room besides the one that just changed
-        filtered_lights = set(filter(lambda light: light != entity, self.lights))
+        self._switched_on_by_automoli.discard(entity)
+        self._switched_off_by_automoli.discard(entity)
 
         how = "manually" if automation_name == "" else "automation"
         if state == "off":
-            # when all of the lights have been turned off then
-            # cancel scheduled callbacks and update stats to set room off
+            # when all of the lights have been turned off (besides the one that just
+            # changed) then cancel scheduled callbacks and update stats to set room off
             # otherwise don't do anything, regular delay should turn other lights off
             if all(
-                [
-                    self.get_state(light, copy=False) == "off"
-                    for light in filtered_lights
-                ]
+                light_state == "off"
+                for light, light_state in self._light_states().items()
+                if light != entity
             ):
                 self.clear_handles()
-                self.lg(
-                    f"{stack()[0][3]}: handles cleared and cancelled all scheduled timers",
-                    level=logging.DEBUG,
-                )
+                if logging.DEBUG >= self.loglevel:
+                    self.lg(
+                        "outside_change_detected: handles cleared and cancelled all scheduled timers",
+                        level=logging.DEBUG,
+                    )
                 self.run_in(
                     self.update_room_stats,
                     0,
@@ -1008,13 +1111,9 @@ class AutoMoLi(hass.Hass):  # type: ignore
             handles = self.room.handles_automoli
             clear = True
 
-        # getting function references for small performance gain below
-        timer_running = self.timer_running
-        cancel_timer = self.cancel_timer
-
         for handle in handles:
-            if timer_running(handle):
-                cancel_timer(handle)
+            if self._timer_running(handle):
+                self._cancel_timer(handle)
 
         if clear:
             self.room.handles_automoli.clear()
@@ -1023,7 +1122,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         self.override_delay_active = False
 
         if logging.DEBUG >= self.loglevel:
-            self.lg(
+            self._lg(
                 f"{stack()[0][3]}: cancelled scheduled callbacks", level=logging.DEBUG
             )
 
@@ -1043,7 +1142,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
             if refresh_type == "motion_cleared":
                 return
             elif refresh_type != "override_delay":
-                self.run_in(
+                self._run_in(
                     self.update_room_stats, 1, stat="overrideDelay", enable=False
                 )
                 self.clear_handles()
@@ -1062,42 +1161,47 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # if no delay is set or delay = 0, lights will not switched off by AutoMoLi
         if delay:
 
-            self.lg(
-                f"{stack()[0][3]} {self.active = } | {self.delay_outside_events = }"
-                f" | {refresh_type = } | {delay = } | {self.dim = }",
-                level=logging.DEBUG,
-            )
+            log = logging.DEBUG >= self.loglevel
+
+            if log:
+                self._lg(
+                    f"{stack()[0][3]} {self.active = } | {self.delay_outside_events = }"
+                    f" | {refresh_type = } | {delay = } | {self.dim = }",
+                    level=logging.DEBUG,
+                )
 
             if self.dim:
                 dim_in_sec = int(delay) - self.dim["seconds_before"]
-                self.lg(f"{stack()[0][3]} {dim_in_sec = }", level=logging.DEBUG)
+                if log:
+                    self._lg(f"{stack()[0][3]} {dim_in_sec = }", level=logging.DEBUG)
 
-                handle = self.run_in(self.dim_lights, dim_in_sec, timeDelay=delay)
+                handle = self._run_in(self.dim_lights, dim_in_sec, timeDelay=delay)
 
             else:
-                handle = self.run_in(self.lights_off, delay, timeDelay=delay)
+                handle = self._run_in(self.lights_off, delay, timeDelay=delay)
 
             self.room.handles_automoli.add(handle)
 
             if timer_info := self.info_timer(handle):
-                self.lg(
-                    f"{stack()[0][3]}: scheduled callback to switch off the lights in {dim_in_sec}s after "
-                    f"{timer_info[0].isoformat()} | "
-                    f"handles: {self.room.handles_automoli = }",
-                    level=logging.DEBUG,
-                )
-                self.run_in(
+                if log:
+                    self._lg(
+                        f"{stack()[0][3]}: scheduled callback to switch off the lights in {dim_in_sec}s after "
+                        f"{timer_info[0].isoformat()} | "
+                        f"handles: {self.room.handles_automoli = }",
+                        level=logging.DEBUG,
+                    )
+                self._run_in(
                     self.update_room_stats, 0, stat="refreshTimer", time=timer_info[0]
                 )
 
             if self.warning_flash and refresh_type != "override_delay":
-                handle = self.run_in(
+                handle = self._run_in(
                     self.warning_flash_off, (int(delay) - DEFAULT_WARNING_DELAY)
                 )
                 self.room.handles_automoli.add(handle)
 
         else:
-            self.lg(
+            self._lg(
                 f"{stack()[0][3]} no delay was set or delay = 0, lights will not be switched off by AutoMoLi",
                 level=logging.DEBUG,
             )
@@ -1107,7 +1211,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
     ) -> None:
         """override the time delay for turning off lights"""
         # only update the delay if any lights are on
-        if any([self.get_state(light, copy=False) == "on" for light in self.lights]):
+        if any(self.get_state(light, copy=False) == "on" for light in self.lights):
             self.override_delay_active = True
             self.run_in(
                 self.update_room_stats,
@@ -1118,119 +1222,142 @@ class AutoMoLi(hass.Hass):  # type: ignore
             )
             self.refresh_timer(refresh_type="override_delay")
 
+    def _light_states(self) -> dict[str, str]:
+        """Get the current state of all lights in the room with a single state lookup."""
+        # fetching the whole namespace without copying it is cheaper than calling
+        # get_state once per light
+        states = self.get_state(copy=False)
+        return {light: states.get(light, {}).get("state") for light in self.lights}
+
     def night_mode_active(self) -> bool:
         return bool(
             self.night_mode
             and self.get_state(self.night_mode["entity"], copy=False) == "on"
         )
 
-    def is_disabled(self, onoff: str = None) -> bool:
-        """check if automoli is disabled via home assistant entity"""
+    def _switch_active(
+        self, entities: Iterable[str], states: set[str]
+    ) -> tuple[str, str] | None:
+        """return the first entity and its state if it is in one of the given states"""
 
         # getting function reference to get_state for small performance gain during for loop
         get_state = self.get_state
 
-        for entity in self.disable_switch_entities:
-            if (
-                state := get_state(entity, copy=False)
-            ) and state in self.disable_switch_states:
-                # Refresh timer if disabling lights from turning off
-                if onoff == "off":
-                    self.refresh_timer()
-                # Only log first time disabled
-                if self.sensor_attr.get("disabled_by", "") == "":
-                    self.lg(
-                        f"{APP_NAME} is disabled by {self.get_name(entity)} with state '{state}'"
-                    )
-                self.run_in(self.update_room_stats, 1, stat="disabled", entity=entity)
-                return True
+        for entity in entities:
+            if (state := get_state(entity, copy=False)) and state in states:
+                return entity, state
+
+        return None
+
+    def _schedule_stats(self, stat: str, **kwargs: Any) -> None:
+        """schedule a room stats update, replacing a pending one for the same stat"""
+
+        if (handle := self._stats_handles.pop(stat, None)) and self._timer_running(
+            handle
+        ):
+            self._cancel_timer(handle)
+        self._stats_handles[stat] = self._run_in(
+            self.update_room_stats, 1, stat=stat, **kwargs
+        )
+
+    def is_disabled(self, onoff: str = None) -> bool:
+        """check if automoli is disabled via home assistant entity"""
+
+        if switch := self._switch_active(
+            self.disable_switch_entities, self.disable_switch_states
+        ):
+            entity, state = switch
+            # Refresh timer if disabling lights from turning off
+            if onoff == "off":
+                self.refresh_timer()
+            # Only log first time disabled
+            if self.sensor_attr.get("disabled_by", "") == "":
+                self.lg(
+                    f"{APP_NAME} is disabled by {self.get_name(entity)} with state '{state}'"
+                )
+            self._schedule_stats("disabled", entity=entity)
+            return True
 
         # or because currently in cooldown period after an outside change
         if self.cooling_down and onoff == "on":
             # Do not need to refresh timer because cooling_down currently
             # only disables lights turning on
             self.lg(f"{APP_NAME} is disabled during cooldown period")
-            self.run_in(
-                self.update_room_stats, 1, stat="disabled", entity="Cooling down"
-            )
+            self._schedule_stats("disabled", entity="Cooling down")
             return True
 
         return False
 
     def is_blocked(self, onoff: str = None) -> bool:
-        # getting function reference to get_state for small performance gain during for loop
-        get_state = self.get_state
-
         if onoff == "on":
-            for entity in self.block_on_switch_entities:
-                if (
-                    state := get_state(entity, copy=False)
-                ) and state in self.block_on_switch_states:
-                    # Do not need to refresh timer when blocking lights turning on
-                    # Only log first time blocked
-                    if self.sensor_attr.get("blocked_on_by", "") == "":
-                        self.lg(
-                            f"Motion detected in {hl(self.room.name.replace('_',' ').title())} "
-                            f"but blocked by {self.get_name(entity)} with state '{state}'"
-                        )
-                    self.run_in(
-                        self.update_room_stats, 1, stat="blockedOn", entity=entity
+            if switch := self._switch_active(
+                self.block_on_switch_entities, self.block_on_switch_states
+            ):
+                entity, state = switch
+                # Do not need to refresh timer when blocking lights turning on
+                # Only log first time blocked
+                if self.sensor_attr.get("blocked_on_by", "") == "":
+                    self.lg(
+                        f"Motion detected in {self._room_pretty_hl} "
+                        f"but blocked by {self.get_name(entity)} with state '{state}'"
                     )
-                    return True
+                self._schedule_stats("blockedOn", entity=entity)
+                return True
         elif onoff == "off":
             # the "shower case"
             if humidity_threshold := self.thresholds.get("humidity"):
+                log = logging.DEBUG >= self.loglevel
                 for sensor in self.sensors[EntityType.HUMIDITY.idx]:
+                    humidity_state = self._get_state(sensor, copy=False)
                     try:
-                        current_humidity = float(
-                            self.get_state(sensor)  # type:ignore
-                        )
-                    except ValueError as error:
+                        current_humidity = float(humidity_state)  # type:ignore
+                    except (TypeError, ValueError) as error:
                         self.lg(
-                            f"{stack()[0][3]}: self.get_state(sensor) raised a ValueError for {sensor}: {error}",
+                            f"is_blocked: could not parse humidity '{humidity_state}' from {sensor}: {error}",
                             level=logging.ERROR,
                         )
                         continue
 
-                    self.lg(
-                        f"{stack()[0][3]}: {current_humidity = } >= {humidity_threshold = } "
-                        f"= {current_humidity >= humidity_threshold}",
-                        level=logging.DEBUG,
-                    )
+                    if log:
+                        self.lg(
+                            f"is_blocked: {current_humidity = } >= {humidity_threshold = } "
+                            f"= {current_humidity >= humidity_threshold}",
+                            level=logging.DEBUG,
+                        )
 
                     if current_humidity >= humidity_threshold:
                         self.refresh_timer()
                         # Only log first time blocked
                         if self.sensor_attr.get("blocked_off_by", "") == "":
                             self.lg(
-                                f"🛁 No motion in {hl(self.room.name.replace('_',' ').title())} since "
+                                f"🛁 No motion in {self._room_pretty_hl} since "
                                 f"{hl(natural_time(int(self.active['delay'])))} → "
                                 f"but {hl(current_humidity)}%RH > "
                                 f"{hl(humidity_threshold)}%RH"
                             )
-                        self.run_in(
-                            self.update_room_stats, 1, stat="blockedOff", entity=sensor
-                        )
+                        self._schedule_stats("blockedOff", entity=sensor)
                         return True
             # other entities
-            for entity in self.block_off_switch_entities:
-                if (
-                    state := get_state(entity, copy=False)
-                ) and state in self.block_off_switch_states:
-                    self.refresh_timer()
-                    # Only log first time blocked
-                    if self.sensor_attr.get("blocked_off_by", "") == "":
-                        self.lg(
-                            f"No motion in {hl(self.room.name.replace('_',' ').title())} since "
-                            f"{hl(natural_time(int(self.active['delay'])))} → "
-                            f"but blocked by {self.get_name(entity)} with state '{state}'"
-                        )
-                    self.run_in(
-                        self.update_room_stats, 1, stat="blockedOff", entity=entity
+            if switch := self._switch_active(
+                self.block_off_switch_entities, self.block_off_switch_states
+            ):
+                entity, state = switch
+                self.refresh_timer()
+                # Only log first time blocked
+                if self.sensor_attr.get("blocked_off_by", "") == "":
+                    self.lg(
+                        f"No motion in {self._room_pretty_hl} since "
+                        f"{hl(natural_time(int(self.active['delay'])))} → "
+                        f"but blocked by {self.get_name(entity)} with state '{state}'"
                     )
-                    return True
+                self._schedule_stats("blockedOff", entity=entity)
+                return True
         return False
 
+    def _no_motion_source(self, delay: int | str) -> str:
+        """room stats source for lights switched off after no motion for delay seconds"""
+        return f"No motion for {plain_natural_time(delay)}"
+
     def dim_lights(self, kwargs: dict[str, Any]) -> None:
         # Note: lights_dimmable, lights_undimmable, and natural_time are defined in the imported library adutils
         # TODO: This codepath has not been tested / exercised in a while. Need to ensure logic still holds and
@@ -1238,10 +1365,12 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         message: str = ""
 
+        log = logging.DEBUG >= self.loglevel
+
         # check logging level here first to avoid duplicate log entries when not debug logging
-        if logging.DEBUG >= self.loglevel:
+        if log:
             self.lg(
-                f"{stack()[0][3]}: {self.is_disabled(onoff='off') = } | {self.is_blocked(onoff='off') = }",
+                f"dim_lights: {self.is_disabled(onoff='off') = } | {self.is_blocked(onoff='off') = }",
                 level=logging.DEBUG,
             )
 
@@ -1249,9 +1378,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         if self.is_disabled(onoff="off") or self.is_blocked(onoff="off"):
             return
 
-        if not any(
-            [self.get_state(light, copy=False) == "on" for light in self.lights]
-        ):
+        if not any(self.get_state(light, copy=False) == "on" for light in self.lights):
             return
 
         dim_method: DimMethod
@@ -1266,17 +1393,18 @@ class AutoMoLi(hass.Hass):  # type: ignore
             seconds_before = int(self.dim["seconds_before"])
             dim_attributes: dict[str, int] = {}
 
-            self.lg(
-                f"{stack()[0][3]}: {dim_method = } | {seconds_before = }",
-                level=logging.DEBUG,
-            )
+            if log:
+                self.lg(
+                    f"dim_lights: {dim_method = } | {seconds_before = }",
+                    level=logging.DEBUG,
+                )
 
             if dim_method == DimMethod.STEP:
                 dim_attributes = {
                     "brightness_step_pct": int(self.dim["brightness_step_pct"])
                 }
                 message = (
-                    f"{hl(self.room.name.replace('_',' ').title())} → "
+                    f"{self._room_pretty_hl} → "
                     f"dim to {hl(self.dim['brightness_step_pct'])} | "
                     f"{hl('off')} in {natural_time(seconds_before)}"
                 )
@@ -1284,25 +1412,26 @@ class AutoMoLi(hass.Hass):  # type: ignore
             elif dim_method == DimMethod.TRANSITION:
                 dim_attributes = {"transition": int(seconds_before)}
                 message = (
-                    f"{hl(self.room.name.replace('_',' ').title())} → transition to "
+                    f"{self._room_pretty_hl} → transition to "
                     f"{hl('off')} in ({natural_time(seconds_before)})"
                 )
 
             self.dimming = True
 
-            self.lg(
-                f"{stack()[0][3]}: {dim_attributes = } | {self.dimming = }",
-                level=logging.DEBUG,
-            )
-
-            self.lg(f"{stack()[0][3]}: {self.room.room_lights = }", level=logging.DEBUG)
-            self.lg(
-                f"{stack()[0][3]}: {self.room.lights_dimmable = }", level=logging.DEBUG
-            )
-            self.lg(
-                f"{stack()[0][3]}: {self.room.lights_undimmable = }",
-                level=logging.DEBUG,
-            )
+            if log:
+                self.lg(
+                    f"dim_lights: {dim_attributes = } | {self.dimming = }",
+                    level=logging.DEBUG,
+                )
+                self.lg(f"dim_lights: {self.room.room_lights = }", level=logging.DEBUG)
+                self.lg(
+                    f"dim_lights: {self.room.lights_dimmable = }",
+                    level=logging.DEBUG,
+                )
+                self.lg(
+                    f"dim_lights: {self.room.lights_undimmable = }",
+                    level=logging.DEBUG,
+                )
 
             if self.room.lights_undimmable:
                 for light in self.room.lights_dimmable:
@@ -1313,8 +1442,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
                         **dim_attributes,  # type:ignore
                     )
                     self.set_state(entity_id=light, state="off")
-                    if light in self._switched_on_by_automoli:
-                        self._switched_on_by_automoli.remove(light)
+                    self._switched_on_by_automoli.discard(light)
                     self._switched_off_by_automoli.add(light)
 
         # workaround to switch off lights that do not support dimming
@@ -1330,10 +1458,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # lights do not support dimming; otherwise need to call it here
         else:
             delay = kwargs.get("timeDelay", 0)
-            timeSinceMotion = (
-                (natural_time(int(delay))).replace("\033[1m", "").replace("\033[0m", "")
-            )
-            source = f"No motion for {timeSinceMotion}, dimming lights"
+            source = f"{self._no_motion_source(delay)}, dimming lights"
             self.run_in(self.update_room_stats, 0, stat="lastOff", source=source)
 
         self.lg(message, icon=OFF_ICON)
@@ -1342,14 +1467,38 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # Note: This is only called from the dim_lights function. Normally,
         # turned_off is called from lights_off.
         if lights := kwargs.get("lights"):
-            self.lg(f"{stack()[0][3]}: {lights = }", level=logging.DEBUG)
-            for light in lights:
-                self.call_service("homeassistant/turn_off", entity_id=light)
-                if light in self._switched_on_by_automoli:
-                    self._switched_on_by_automoli.remove(light)
-                self._switched_off_by_automoli.add(light)
+            if logging.DEBUG >= self.loglevel:
+                self.lg(f"turn_off_lights: {lights = }", level=logging.DEBUG)
+            self.call_service("homeassistant/turn_off", entity_id=list(lights))
+            self._switched_on_by_automoli.difference_update(lights)
+            self._switched_off_by_automoli.update(lights)
             self.run_in(self.turned_off, 0)
 
+    def _finalize_lights_on(self, source: str, setting: str) -> None:
+        """update stats, log and run the 'after_on' entities once lights were turned on"""
+
+        if source != "daytime change" and source != "<unknown>":
+            source = self.get_name(source)
+
+        # if room is not already "on" update stats
+        if self.sensor_state == "off":
+            self.run_in(self.update_room_stats, 1, stat="lastOn", source=source)
+
+        self.lg(
+            f"{self._room_pretty_hl} turned {hl('on')} by {hl(source)} → {setting}"
+            f" | delay: {hl(natural_time(int(self.active['delay'])))}",
+            icon=ON_ICON,
+        )
+
+        # If there are any actions to take after the lights are on then run them now
+        if self.after_on:
+            if logging.DEBUG >= self.loglevel:
+                self.lg(
+                    f"_finalize_lights_on: Lights are on. Now turning on the following 'after_on' entities {self.after_on}",
+                    level=logging.DEBUG,
+                )
+            self.turn_on_entities(self.after_on)
+
     def lights_on(self, source: str = "<unknown>", force: bool = False) -> None:
         """Turn on the lights."""
 
@@ -1358,7 +1507,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # check logging level here first to avoid duplicate log entries when not debug logging
         if log:
             self.lg(
-                f"{stack()[0][3]}: {self.is_disabled(onoff='on') = } | {self.is_blocked(onoff='on') = } | {self.dimming = }",
+                f"lights_on: {self.is_disabled(onoff='on') = } | {self.is_blocked(onoff='on') = } | {self.dimming = }",
                 level=logging.DEBUG,
             )
 
@@ -1366,51 +1515,74 @@ class AutoMoLi(hass.Hass):  # type: ignore
         if self.is_disabled(onoff="on") or self.is_blocked(onoff="on"):
             return
 
+        # getting function and attribute references for small performance gain below
+        get_state = self.get_state
+        call_service = self.call_service
+        active = self.active
+        is_hue_group = active["is_hue_group"]
+        lights = self.lights
+        light_domains = self._light_domains
+        switched_on = self._switched_on_by_automoli
+        switched_off = self._switched_off_by_automoli
+        illuminance_threshold = self.thresholds.get(EntityType.ILLUMINANCE.idx)
+
         if log:
             self.lg(
-                f"{stack()[0][3]}: {self.thresholds.get(EntityType.ILLUMINANCE.idx) = }"
+                f"lights_on: {illuminance_threshold = }"
                 f" | {self.dimming = } | {force = }",
                 level=logging.DEBUG,
             )
 
-        # getting function references for small performance gain below
-        get_state = self.get_state
-        call_service = self.call_service
-        is_hue_group = self.active["is_hue_group"]
-        lights = self.lights
+        # reuse a recent illuminance verdict instead of reading the sensors again
+        now = monotonic()
+        if (
+            illuminance_threshold
+            and (cache := self._illuminance_cache)
+            and now - cache[0] < ILLUMINANCE_CACHE_SEC
+        ):
+            if cache[1]:
+                if log:
+                    self.lg(
+                        "lights_on: already bright enough according to the last check",
+                        level=logging.DEBUG,
+                    )
+                return
 
-        if illuminance_threshold := self.thresholds.get(EntityType.ILLUMINANCE.idx):
+        elif illuminance_threshold:
 
             # the "eco mode" check
             sensors = self.sensors[EntityType.ILLUMINANCE.idx]
             for sensor in sensors:
+                # fetch the state once and reuse it for logging and parsing
+                illuminance_state = get_state(sensor, copy=False)
                 if log:
                     self.lg(
-                        f"{stack()[0][3]}: {illuminance_threshold = } | "
-                        f"{float(get_state(sensor, copy=False)) = }",  # type:ignore
+                        f"lights_on: {illuminance_threshold = } | "
+                        f"{illuminance_state = }",
                         level=logging.DEBUG,
                     )
                 try:
                     if (
-                        illuminance := float(
-                            get_state(sensor)  # type:ignore
-                        )  # type:ignore
+                        illuminance := float(illuminance_state)  # type:ignore
                     ) >= illuminance_threshold:
                         self.lg(
                             f"According to {hl(sensor)} its already bright enough ¯\\_(ツ)_/¯"
                             f" | {illuminance} >= {illuminance_threshold}"
                         )
+                        self._illuminance_cache = (now, True)
                         return
 
-                except ValueError as error:
+                except (TypeError, ValueError) as error:
                     self.lg(
-                        f"Could not parse illuminance '{get_state(sensor, copy=False)}' "
+                        f"Could not parse illuminance '{illuminance_state}' "
                         f"from '{sensor}': {error}"
                     )
                     return
 
+            self._illuminance_cache = (now, False)
+
         light_setting = (
-            self.active.get("light_setting")
+            active.get("light_setting")
             if not self.night_mode_active()
             else self.night_mode.get("light")
         )
@@ -1419,153 +1591,120 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         if isinstance(light_setting, str):
 
-            # Start by iterating through all of the lights and turn them on
+            # Start by iterating through all of the lights and turn them on,
+            # lights that are off are collected and turned on with a single service call
+            turn_on: list[str] = []
             for entity in lights:
+                # only look up the entity's hue group attribute if the daytime uses hue groups
+                entity_is_hue = is_hue_group and get_state(
+                    entity_id=entity, attribute="is_hue_group", copy=False
+                )
                 if log:
                     self.lg(
-                        f"{stack()[0][3]}: entity: {entity} | startswith: {entity.split('.')[0]} | "
-                        f"is_hue_group: {self.active['is_hue_group'] and get_state(entity_id=entity, attribute='is_hue_group')} | "
-                        f"switched_on_by_automoli: {entity in self._switched_on_by_automoli}",
+                        f"lights_on: entity: {entity} | startswith: {entity.split('.')[0]} | "
+                        f"is_hue_group: {entity_is_hue} | "
+                        f"switched_on_by_automoli: {entity in switched_on}",
                         level=logging.DEBUG,
                     )
-                if is_hue_group and get_state(
-                    entity_id=entity, attribute="is_hue_group"
-                ):
+                if entity_is_hue:
                     call_service(
                         "hue/hue_activate_scene",
                         group_name=self.friendly_name(entity),  # type:ignore
                         scene_name=light_setting,  # type:ignore
                     )
                     # Considering that activating a scene is the equivalent of turning it on
-                    if not entity in self._switched_on_by_automoli:
-                        self._switched_on_by_automoli.add(entity)
-                    if entity in self._switched_off_by_automoli:
-                        self._switched_off_by_automoli.remove(entity)
+                    switched_on.add(entity)
+                    switched_off.discard(entity)
                     at_least_one_turned_on = True
                 elif get_state(entity, copy=False) == "off":
-                    call_service(
-                        "homeassistant/turn_on", entity_id=entity  # type:ignore
-                    )
-                    if not entity in self._switched_on_by_automoli:
-                        self._switched_on_by_automoli.add(entity)
-                    if entity in self._switched_off_by_automoli:
-                        self._switched_off_by_automoli.remove(entity)
-                    at_least_one_turned_on = True
+                    turn_on.append(entity)
+
+            if turn_on:
+                call_service("homeassistant/turn_on", entity_id=turn_on)  # type:ignore
+                switched_on.update(turn_on)
+                switched_off.difference_update(turn_on)
+                at_least_one_turned_on = True
 
             # Then if the light_setting is a scene or script apply it after
-            if light_setting.startswith("scene.") or light_setting.startswith(
-                "script."
-            ):
+            if light_setting.startswith(SCENE_SCRIPT_PREFIXES):
                 call_service(
                     "homeassistant/turn_on", entity_id=light_setting  # type:ignore
                 )
 
             if at_least_one_turned_on:
-                if source != "daytime change" and source != "<unknown>":
-                    source = self.get_name(source)
-
-                # if room is not already "on" update stats
-                if self.sensor_state == "off":
-                    self.run_in(self.update_room_stats, 1, stat="lastOn", source=source)
-
-                self.lg(
-                    f"{hl(self.room.name.replace('_',' ').title())} turned {hl('on')} by {hl(source)} → "
-                    f"{'hue scene:' if self.active['is_hue_group'] else ''} "
-                    f"{hl(light_setting)}"
-                    f" | delay: {hl(natural_time(int(self.active['delay'])))}",
-                    icon=ON_ICON,
+                self._finalize_lights_on(
+                    source,
+                    f"{'hue scene:' if is_hue_group else ''} {hl(light_setting)}",
                 )
 
-                # If there are any actions to take after the lights are on then run them now
-                if self.after_on:
+            else:
+                if log:
                     self.lg(
-                        f"{stack()[0][3]}: Lights are on. Now turning on the following 'after_on' entities {self.after_on}.",
+                        f"lights_on: lights in {self._room_pretty} were already on"
+                        f" | {self.dimming = }",
                         level=logging.DEBUG,
                     )
-                    self.turn_on_entities(self.after_on)
-
-            else:
-                self.lg(
-                    f"{stack()[0][3]}: lights in {self.room.name.replace('_',' ').title()} were already on"
-                    f" | {self.dimming = }",
-                    level=logging.DEBUG,
-                )
 
         elif isinstance(light_setting, int):
 
             if light_setting == 0:
-                if all([get_state(entity, copy=False) == "off" for entity in lights]):
-                    self.lg(
-                        f"{stack()[0][3]}: no lights turned on because current 'daytime' light setting is 0",
-                        level=logging.DEBUG,
-                    )
+                if all(get_state(entity, copy=False) == "off" for entity in lights):
+                    if log:
+                        self.lg(
+                            "lights_on: no lights turned on because current 'daytime' light setting is 0",
+                            level=logging.DEBUG,
+                        )
                 # if lights are on only turn them off if force is true (there is a daytime change)
                 elif force:
                     self.run_in(self.lights_off, 0, daytimeChange=True)
 
             else:
+                # collect the entities to switch on and turn them on with one service
+                # call for lights (with brightness) and one for any other entities
+                turn_on_lights: list[str] = []
+                turn_on_others: list[str] = []
                 for entity in lights:
                     if log:
                         self.lg(
-                            f"{stack()[0][3]}: entity: {entity} | startswith: {entity.split('.')[0]} | switched_on_by_automoli: {entity in self._switched_on_by_automoli}",
+                            f"lights_on: entity: {entity} | startswith: {entity.split('.')[0]} | switched_on_by_automoli: {entity in switched_on}",
                             level=logging.DEBUG,
                         )
                     state = get_state(entity, copy=False)
-                    is_light = entity.startswith("light")
+                    is_light = light_domains[entity]
                     if is_light and (force or self.dimming or state == "off"):
-                        call_service(
-                            "homeassistant/turn_on",
-                            entity_id=entity,  # type:ignore
-                            brightness_pct=light_setting,  # type:ignore
-                        )
-                        if not entity in self._switched_on_by_automoli:
-                            self._switched_on_by_automoli.add(entity)
-                        if entity in self._switched_off_by_automoli:
-                            self._switched_off_by_automoli.remove(entity)
-                        at_least_one_turned_on = True
+                        turn_on_lights.append(entity)
 
                     # Otherwise turn on any lights that are off
                     elif not is_light and state == "off":
-                        call_service(
-                            "homeassistant/turn_on", entity_id=entity  # type:ignore
-                        )
-                        if not entity in self._switched_on_by_automoli:
-                            self._switched_on_by_automoli.add(entity)
-                        if entity in self._switched_off_by_automoli:
-                            self._switched_off_by_automoli.remove(entity)
-                        at_least_one_turned_on = True
-
-                if at_least_one_turned_on:
-                    if source != "daytime change" and source != "<unknown>":
-                        source = self.get_name(source)
+                        turn_on_others.append(entity)
 
-                    # if room is not already "on" update stats
-                    if self.sensor_state == "off":
-                        self.run_in(
-                            self.update_room_stats, 1, stat="lastOn", source=source
-                        )
+                if turn_on_lights:
+                    call_service(
+                        "homeassistant/turn_on",
+                        entity_id=turn_on_lights,  # type:ignore
+                        brightness_pct=light_setting,  # type:ignore
+                    )
+                if turn_on_others:
+                    call_service(
+                        "homeassistant/turn_on", entity_id=turn_on_others  # type:ignore
+                    )
+                if turned_on := turn_on_lights + turn_on_others:
+                    switched_on.update(turned_on)
+                    switched_off.difference_update(turned_on)
+                    at_least_one_turned_on = True
 
-                    self.lg(
-                        f"{hl(self.room.name.replace('_',' ').title())} turned {hl('on')} by {hl(source)} → "
-                        f"brightness: {hl(light_setting)}%"
-                        f" | delay: {hl(natural_time(int(self.active['delay'])))}",
-                        icon=ON_ICON,
+                if at_least_one_turned_on:
+                    self._finalize_lights_on(
+                        source, f"brightness: {hl(light_setting)}%"
                     )
 
-                    # If there are any actions to take after the lights are on then run them now
-                    if self.after_on:
+                else:
+                    if log:
                         self.lg(
-                            f"{stack()[0][3]}: Lights are on. Now turning on the following 'after_on' entities {self.after_on}",
+                            f"lights_on: lights in {self._room_pretty} were already on"
+                            f" | {self.dimming = }",
                             level=logging.DEBUG,
                         )
-                        self.turn_on_entities(self.after_on)
-
-                else:
-                    self.lg(
-                        f"{stack()[0][3]}: lights in {self.room.name.replace('_',' ').title()} were already on"
-                        f" | {self.dimming = }",
-                        level=logging.DEBUG,
-                    )
 
         else:
             raise ValueError(
@@ -1578,7 +1717,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # check logging level here first to avoid duplicate log entries when not debug logging
         if logging.DEBUG >= self.loglevel:
             self.lg(
-                f"{stack()[0][3]}: {self.is_disabled(onoff='off') = } | {self.is_blocked(onoff='off') = }",
+                f"lights_off: {self.is_disabled(onoff='off') = } | {self.is_blocked(onoff='off') = }",
                 level=logging.DEBUG,
             )
 
@@ -1591,37 +1730,23 @@ class AutoMoLi(hass.Hass):  # type: ignore
         # cancel scheduled callbacks
         self.clear_handles()
 
-        self.lg(
-            f"{stack()[0][3]}: "
-            f"{any([self.get_state(entity, copy=False) == 'on' for entity in self.lights]) = }"
-            f" | {self.lights = }",
-            level=logging.DEBUG,
-        )
+        if logging.DEBUG >= self.loglevel:
+            self.lg(
+                f"lights_off: "
+                f"{any(self.get_state(entity, copy=False) == 'on' for entity in self.lights) = }"
+                f" | {self.lights = }",
+                level=logging.DEBUG,
+            )
 
         at_least_one_turned_off = kwargs.get("one_turned_off_already", False)
         at_least_one_error = False
+        # collect the lights to switch off and turn them off with a single service call
+        turn_off: list[str] = []
         for entity in self.lights:
             state = self.get_state(entity, copy=False)
             if state == "on":
-                if self.only_own_events:
-                    if entity in self._switched_on_by_automoli:
-                        self.call_service(
-                            "homeassistant/turn_off", entity_id=entity  # type:ignore
-                        )  # type:ignore
-                        if entity in self._switched_on_by_automoli:
-                            self._switched_on_by_automoli.remove(entity)
-                        if entity not in self._switched_off_by_automoli:
-                            self._switched_off_by_automoli.add(entity)
-                        at_least_one_turned_off = True
-                else:
-                    self.call_service(
-                        "homeassistant/turn_off", entity_id=entity  # type:ignore
-                    )  # type:ignore
-                    if entity in self._switched_on_by_automoli:
-                        self._switched_on_by_automoli.remove(entity)
-                    if entity not in self._switched_off_by_automoli:
-                        self._switched_off_by_automoli.add(entity)
-                    at_least_one_turned_off = True
+                if not self.only_own_events or entity in self._switched_on_by_automoli:
+                    turn_off.append(entity)
             elif state in NOT_READY_STATES:
                 at_least_one_error = True
                 self.lg(
@@ -1629,6 +1754,14 @@ class AutoMoLi(hass.Hass):  # type: ignore
                     icon=ALERT_ICON,
                 )
 
+        if turn_off:
+            self.call_service(
+                "homeassistant/turn_off", entity_id=turn_off  # type:ignore
+            )
+            self._switched_on_by_automoli.difference_update(turn_off)
+            self._switched_off_by_automoli.update(turn_off)
+            at_least_one_turned_off = True
+
         # only run if there were no errors
         if at_least_one_turned_off and not at_least_one_error:
             delay = kwargs.get("timeDelay", 0)
@@ -1639,10 +1772,11 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
             # If there are any actions to take after the lights are off then run them now
             if self.after_off:
-                self.lg(
-                    f"{stack()[0][3]}: Lights are off. Now turning on the following 'after_off' entities {self.after_off}.",
-                    level=logging.DEBUG,
-                )
+                if logging.DEBUG >= self.loglevel:
+                    self.lg(
+                        f"lights_off: Lights are off. Now turning on the following 'after_off' entities {self.after_off}.",
+                        level=logging.DEBUG,
+                    )
                 self.turn_on_entities(self.after_off)
 
         # experimental | reset for xiaomi "super motion" sensors | idea from @wernerhp
@@ -1684,7 +1818,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
         if overrideDelay:
             overriddenBy = self.sensor_attr.get("delay_overridden_by", "")
             self.lg(
-                f"No motion in {hl(self.room.name.replace('_',' ').title())} for "
+                f"No motion in {self._room_pretty_hl} for "
                 f"{hl(natural_time(int(delay)))} overridden by {overriddenBy} → turned {hl('off')}",
                 icon=OFF_ICON,
             )
@@ -1693,20 +1827,17 @@ class AutoMoLi(hass.Hass):  # type: ignore
         elif daytimeChange:
             self.lg(
                 f"Daytime changed light setting to 0% in "
-                f"{hl(self.room.name.replace('_',' ').title())} → turned {hl('off')}",
+                f"{self._room_pretty_hl} → turned {hl('off')}",
                 icon=OFF_ICON,
             )
             source = "Daytime changed light setting to 0%"
         else:
             self.lg(
-                f"No motion in {hl(self.room.name.replace('_',' ').title())} for "
+                f"No motion in {self._room_pretty_hl} for "
                 f"{hl(natural_time(int(delay)))} → turned {hl('off')}",
                 icon=OFF_ICON,
             )
-            timeSinceMotion = (
-                (natural_time(int(delay))).replace("\033[1m", "").replace("\033[0m", "")
-            )
-            source = f"No motion for {timeSinceMotion}"
+            source = self._no_motion_source(delay)
 
         # Update room stats to record room turned off
         self.run_in(self.update_room_stats, 0, stat="lastOff", source=source)
@@ -1722,21 +1853,16 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         # Log how long lights were on
         currentTime = datetime.now()
-        try:
-            lastOn = datetime.strptime(
-                self.sensor_attr["last_turned_on"], DATETIME_FORMAT
-            )
-        except KeyError:
+        if (lastOn := self._last_turned_on) is None:
             lastOn = currentTime
-            self.lg(
-                f"{stack()[0][3]}: there is no record of the lights already being on",
-                level=logging.DEBUG,
-            )
-        difference = int(datetime.timestamp(datetime.now())) - int(
-            datetime.timestamp(lastOn)
-        )
+            if logging.DEBUG >= self.loglevel:
+                self.lg(
+                    "turned_off: there is no record of the lights already being on",
+                    level=logging.DEBUG,
+                )
+        difference = int(currentTime.timestamp()) - int(lastOn.timestamp())
         self.lg(
-            f"  {hl(self.room_name.replace('_',' ').title())} was on for "
+            f"  {self._room_pretty_hl} was on for "
             f"{self.seconds_to_time(difference, True)} since {lastOn.strftime(DATETIME_FORMAT)}."
         )
 
@@ -1748,13 +1874,21 @@ class AutoMoLi(hass.Hass):  # type: ignore
         As many entities as can be processed will be. Returns a set of any entities that were not ready.
         """
         not_ready: set[str] = set()
+        ready: list[str] = []
+
+        # getting references for small performance gain during for loop
+        get_state = self.get_state
+        not_ready_states = NOT_READY_STATES
 
         for entity in entities:
-            state = self.get_state(entity, copy=False)
-            if state in NOT_READY_STATES:
+            if get_state(entity, copy=False) in not_ready_states:
                 not_ready.add(entity)
             else:
-                self.turn_on(entity)
+                ready.append(entity)
+
+        # turn on all ready entities with a single service call
+        if ready:
+            self.call_service("homeassistant/turn_on", entity_id=ready)  # type:ignore
 
         return not_ready if len(not_ready) > 0 else None
 
@@ -1764,40 +1898,37 @@ class AutoMoLi(hass.Hass):  # type: ignore
         if self.is_disabled(onoff="off") or self.is_blocked(onoff="off"):
             return
 
-        self.lg(
-            f"{stack()[0][3]}: lights will be turned off in {hl(self.room.name.replace('_',' ').title())} in "
-            f"{DEFAULT_WARNING_DELAY} seconds → flashing warning",
-            level=logging.DEBUG,
-        )
+        if logging.DEBUG >= self.loglevel:
+            self.lg(
+                f"warning_flash_off: lights will be turned off in {self._room_pretty_hl} in "
+                f"{DEFAULT_WARNING_DELAY} seconds → flashing warning",
+                level=logging.DEBUG,
+            )
 
         # turn off lights that are on and save those in self._warning_lights to turn back on
-        at_least_one_turned_off = False
-        for entity in self.lights:
-            if self.get_state(entity, copy=False) == "on":
-                self._warning_lights.add(entity)
-                self.call_service(
-                    "homeassistant/turn_off", entity_id=entity  # type:ignore
-                )  # type:ignore
-                at_least_one_turned_off = True
-                if entity in self._switched_on_by_automoli:
-                    self._switched_on_by_automoli.remove(entity)
-                if entity not in self._switched_off_by_automoli:
-                    self._switched_off_by_automoli.add(entity)
-
-        # turn lights on again in 1s
-        if at_least_one_turned_off:
+        turn_off = [
+            light for light, state in self._light_states().items() if state == "on"
+        ]
+        if turn_off:
+            self.call_service(
+                "homeassistant/turn_off", entity_id=turn_off  # type:ignore
+            )
+            self._warning_lights.update(turn_off)
+            self._switched_on_by_automoli.difference_update(turn_off)
+            self._switched_off_by_automoli.update(turn_off)
+
+            # turn lights on again in 1s
             self.run_in(self.warning_flash_on, 1)
 
     def warning_flash_on(self, _: dict[str, Any] | None = None) -> None:
         # turn lights back on after 1s delay
-        for entity in self._warning_lights:
+        if self._warning_lights:
             self.call_service(
-                "homeassistant/turn_on", entity_id=entity  # type:ignore
-            )  # type:ignore
-            if entity in self._switched_off_by_automoli:
-                self._switched_off_by_automoli.remove(entity)
-            if entity not in self._switched_on_by_automoli:
-                self._switched_on_by_automoli.add(entity)
+                "homeassistant/turn_on",
+                entity_id=list(self._warning_lights),  # type:ignore
+            )
+            self._switched_off_by_automoli.difference_update(self._warning_lights)
+            self._switched_on_by_automoli.update(self._warning_lights)
         self._warning_lights.clear()
 
     def find_sensors(
@@ -1806,31 +1937,21 @@ class AutoMoLi(hass.Hass):  # type: ignore
         """Find sensors by looking for a keyword in the friendly_name."""
 
         def lower_umlauts(text: str, single: bool = True) -> str:
-            return (
-                text.replace("ä", "a")
-                .replace("ö", "o")
-                .replace("ü", "u")
-                .replace("ß", "s")
-                if single
-                else text.replace("ä", "ae")
-                .replace("ö", "oe")
-                .replace("ü", "ue")
-                .replace("ß", "ss")
-            ).lower()
-
-        matches: list[str] = []
-        for state in states.values():
-            if keyword in (entity_id := state.get("entity_id", "")) and lower_umlauts(
-                room_name
-            ) in "|".join(
-                [
-                    entity_id,
-                    lower_umlauts(state.get("attributes", {}).get("friendly_name", "")),
-                ]
-            ):
-                matches.append(entity_id)
+            return text.translate(UMLAUTS_SINGLE if single else UMLAUTS_DOUBLE).lower()
 
-        return matches
+        room = lower_umlauts(room_name)
+
+        # the friendly name is only normalized if the entity id does not match already
+        return [
+            entity_id
+            for state in states.values()
+            if keyword in (entity_id := state.get("entity_id", ""))
+            and (
+                room in entity_id
+                or room
+                in lower_umlauts(state.get("attributes", {}).get("friendly_name", ""))
+            )
+        ]
 
     def configure_night_mode(
         self, night_mode: dict[str, int | str]
@@ -1851,22 +1972,24 @@ class AutoMoLi(hass.Hass):  # type: ignore
     def build_daytimes(self, daytimes: list[Any]) -> list[dict[str, int | str]] | None:
         starttimes: set[time] = set()
 
-        for idx, daytime in enumerate(daytimes):
+        # the lights are the same for every daytime, so check for hue groups only once
+        any_hue_group = not self.disable_hue_groups and any(
+            self.get_state(entity_id=entity, attribute="is_hue_group", copy=False)
+            for entity in self.lights
+        )
+
+        # pair each daytime with the one following it (the last one wraps around)
+        next_daytimes = daytimes[1:] + daytimes[:1]
+
+        for idx, (daytime, next_daytime) in enumerate(zip(daytimes, next_daytimes)):
             dt_name = daytime.get("name", f"{DEFAULT_NAME}_{idx}")
             dt_delay = daytime.get("delay", self.delay)
             dt_light_setting = daytime.get("light", DEFAULT_LIGHT_SETTING)
-            if self.disable_hue_groups:
-                dt_is_hue_group = False
-            else:
-                dt_is_hue_group = (
-                    isinstance(dt_light_setting, str)
-                    and not dt_light_setting.startswith("scene.")
-                    and not dt_light_setting.startswith("script.")
-                    and any(
-                        self.get_state(entity_id=entity, attribute="is_hue_group")
-                        for entity in self.lights
-                    )
-                )
+            dt_is_hue_group = (
+                any_hue_group
+                and isinstance(dt_light_setting, str)
+                and not dt_light_setting.startswith(SCENE_SCRIPT_PREFIXES)
+            )
 
             dt_start: time
             try:
@@ -1881,23 +2004,21 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 ) from error
 
             # configuration for this daytime
-            daytime = dict(
-                daytime=dt_name,
-                delay=dt_delay,
-                starttime=dt_start.isoformat(),  # datetime is not serializable
-                light_setting=dt_light_setting,
-                is_hue_group=dt_is_hue_group,
-            )
+            daytime = {
+                "daytime": dt_name,
+                "delay": dt_delay,
+                "starttime": dt_start.isoformat(),  # datetime is not serializable
+                "light_setting": dt_light_setting,
+                "is_hue_group": dt_is_hue_group,
+            }
 
             # info about next daytime
             next_dt_name = DEFAULT_NAME
             try:
-                next_starttime = str(
-                    daytimes[(idx + 1) % len(daytimes)].get("starttime")
-                )
+                next_starttime = str(next_daytime.get("starttime"))
                 if next_starttime.count(":") == 1:
                     next_starttime += ":00"
-                next_dt_name = str(daytimes[(idx + 1) % len(daytimes)].get("name"))
+                next_dt_name = str(next_daytime.get("name"))
                 next_dt_start = (self.parse_time(next_starttime)).replace(microsecond=0)
             except ValueError as error:
                 raise ValueError(
@@ -1918,7 +2039,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 self.now_is_between(str(dt_start), str(next_dt_start))
                 or len(daytimes) == 1
             ):
-                self.switch_daytime(dict(daytime=daytime, initial=True))
+                self.switch_daytime({"daytime": daytime, "initial": True})
                 self.active_daytime = daytime.get("daytime")
 
             # schedule callbacks for daytime switching
@@ -1927,7 +2048,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 dt_start,
                 random_start=-RANDOMIZE_SEC,
                 random_end=RANDOMIZE_SEC,
-                **dict(daytime=daytime),
+                daytime=daytime,
             )
 
         return daytimes
@@ -1958,13 +2079,16 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
         listeners = self.config.pop("listeners", None)
 
-        for key, value in self.config.items():
+        # hide "internal keys" when displaying config
+        visible = [
+            (key, value)
+            for key, value in self.config.items()
+            if key not in HIDDEN_CONFIG_KEYS and not key.startswith("_")
+        ]
 
-            # hide "internal keys" when displaying config
-            if key in ["module", "class"] or key.startswith("_"):
-                continue
+        for key, value in visible:
 
-            if isinstance(value, (list, set)):
+            if isinstance(value, (list, set, tuple)):
                 self.print_collection(key, value, 2)
             elif isinstance(value, dict):
                 self.print_collection(key, value, 2)
@@ -1999,7 +2123,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
 
             elif isinstance(collection, dict):
 
-                if isinstance(collection[item], set):
+                if isinstance(collection[item], (set, tuple)):
                     self.print_collection(item, collection[item], indentation)
                 else:
                     self._print_cfg_setting(item, collection[item], indentation)
@@ -2032,7 +2156,28 @@ class AutoMoLi(hass.Hass):  # type: ignore
             self.lg(f"{indent}{key}: {prefix}{hl(value)}{unit}", log_to_ha=False)
 
     def get_name(self, entity_id: str) -> str:
-        return self.get_state(entity_id, attribute="friendly_name", default=entity_id)
+        if (name := self._name_cache.get(entity_id)) is None:
+            if self.entity_exists(entity_id):
+                name = self.get_state(
+                    entity_id, attribute="friendly_name", default=entity_id, copy=False
+                )
+                # watch the entity so a rename is picked up
+                self._name_handles[entity_id] = self.listen_state(
+                    self.name_changed, entity_id=entity_id, attribute="friendly_name"
+                )
+            elif "." in entity_id:
+                # entity not (yet) known to HA, look it up again next time
+                return entity_id
+            else:
+                # plain labels like "Cooling down" are used as they are
+                name = entity_id
+            self._name_cache[entity_id] = name
+        return name
+
+    def name_changed(
+        self, entity: str, attribute: str, old: str, new: str, _: dict[str, Any]
+    ) -> None:
+        self._name_cache[entity] = new or entity
 
     def room_event(self, event: str, data: dict[str, str], _: dict[str, Any]) -> None:
         if event == EVENT_AUTOMOLI_STATS:
@@ -2077,10 +2222,9 @@ class AutoMoLi(hass.Hass):  # type: ignore
     # there is an attribute change (e.g., the color of the light changes).
 
     def init_room_stats(self, _: Any | None = None) -> None:
-        entity = self.get_state(self.entity_id)
-        self.sensor_attr["friendly_name"] = (
-            self.room_name.replace("_", " ").title() + " Statistics"
-        )
+        # fetch the whole stats entity once and read its attributes locally
+        entity = self.get_state(self.entity_id, attribute="all", copy=False)
+        self.sensor_attr["friendly_name"] = self._room_pretty + " Statistics"
 
         # Only initialize if entity doesn't exist or if last update was before today
         if entity == None:
@@ -2102,276 +2246,108 @@ class AutoMoLi(hass.Hass):  # type: ignore
         else:
             # Check if sensor was last updated before today
             today = date.today()
-            lastUpdated: datetime = self.convert_utc(
-                self.get_state(self.entity_id, attribute="last_updated")
-            )
-            local_timezone = tz.tzlocal()
-            lastUpdatedLocal = lastUpdated.astimezone(local_timezone)
-            lastUpdatedDate = date(
-                lastUpdatedLocal.year, lastUpdatedLocal.month, lastUpdatedLocal.day
-            )
+            lastUpdated: datetime = self.convert_utc(entity["last_updated"])
+            lastUpdatedDate = lastUpdated.astimezone(LOCAL_TIMEZONE).date()
             if today != lastUpdatedDate:
                 self.reset_room_stats()
                 return
             else:
                 # Read daily statistics from existing sensor
-                self.sensor_attr["time_lights_on_today"] = self.get_state(
-                    self.entity_id, attribute="time_lights_on_today", default="00:00:00"
+                attrs = entity.get("attributes", {})
+                self.sensor_attr["time_lights_on_today"] = attrs.get(
+                    "time_lights_on_today", ZERO_TIME
                 )
 
-                self.sensor_onToday = (
-                    datetime.strptime(
-                        self.sensor_attr["time_lights_on_today"], TIME_FORMAT
-                    )
-                    - datetime(1900, 1, 1)
-                ).total_seconds()
-                if (
-                    countAutomoliOn := self.get_state(
-                        self.entity_id, "times_turned_on_by_automoli", default=0
-                    )
-                ) != 0:
-                    self.sensor_attr["times_turned_on_by_automoli"] = countAutomoliOn
-                if (
-                    countAutomoliOff := self.get_state(
-                        self.entity_id, "times_turned_off_by_automoli", default=0
-                    )
-                ) != 0:
-                    self.sensor_attr["times_turned_off_by_automoli"] = countAutomoliOff
-                if (
-                    countAutomationOn := self.get_state(
-                        self.entity_id, "times_turned_on_by_automations", default=0
-                    )
-                ) != 0:
-                    self.sensor_attr["times_turned_on_by_automations"] = (
-                        countAutomationOn
-                    )
-                if (
-                    countAutomationOff := self.get_state(
-                        self.entity_id, "times_turned_off_by_automations", default=0
-                    )
-                ) != 0:
-                    self.sensor_attr["times_turned_off_by_automations"] = (
-                        countAutomationOff
-                    )
-                if (
-                    countManualOn := self.get_state(
-                        self.entity_id, "times_turned_on_manually", default=0
-                    )
-                ) != 0:
-                    self.sensor_attr["times_turned_on_manually"] = countManualOn
-                if (
-                    countManualOff := self.get_state(
-                        self.entity_id, "times_turned_off_manually", default=0
-                    )
-                ) != 0:
-                    self.sensor_attr["times_turned_off_manually"] = countManualOff
+                self.sensor_onToday = self.time_to_seconds(
+                    self.sensor_attr["time_lights_on_today"]
+                )
+                for counter in COUNTER_ATTRS:
+                    if (count := attrs.get(counter, 0)) != 0:
+                        self.sensor_attr[counter] = count
 
-        self.sensor_state = (
-            "on"
-            if any(
-                [self.get_state(entity, copy=False) == "on" for entity in self.lights]
-            )
-            else "off"
-        )
+        self.sensor_state = "on" if "on" in self._light_states().values() else "off"
 
         # Set last_turned_on to now() if light is on when initialize
         if self.sensor_state == "on":
-            currentTime = datetime.now()
-            currentTimeStr = currentTime.strftime(DATETIME_FORMAT)
-            self.sensor_attr["last_turned_on"] = currentTimeStr
+            self._last_turned_on = datetime.now().replace(microsecond=0)
+            self.sensor_attr["last_turned_on"] = self._last_turned_on.strftime(
+                DATETIME_FORMAT
+            )
 
         # Remove debug message if debugging is off
         if logging.DEBUG < self.loglevel:
-            self.sensor_attr.pop("debug_message", 0)
+            self.sensor_attr.pop("debug_message", None)
 
-        if self.track_room_stats:
-            self.set_state(
-                entity_id=self.entity_id,
-                state=self.sensor_state,
-                attributes=self.sensor_attr,
-                replace=True,
-            )
+        self.write_room_stats()
+
+    def write_room_stats(self) -> None:
+        """write the room stats entity, unless it already has this state and attributes"""
+        if not self.track_room_stats:
+            return
+
+        if self._written_stats == (self.sensor_state, self.sensor_attr):
+            return
+
+        self.set_state(
+            entity_id=self.entity_id,
+            state=self.sensor_state,
+            attributes=self.sensor_attr,
+            replace=True,
+        )
+        self._written_stats = (self.sensor_state, dict(self.sensor_attr))
 
     def reset_room_stats(self, _: Any | None = None) -> None:
+        sensor_attr = self.sensor_attr
         self.sensor_onToday = 0
-        self.sensor_attr["time_lights_on_today"] = self.seconds_to_time(
-            self.sensor_onToday
-        )
+        sensor_attr["time_lights_on_today"] = self.seconds_to_time(self.sensor_onToday)
 
         # If lights are on, check if they were last turned on by automoli or manually
         # If a restart happened and reset is called, assume lights were turned on manually
-        if any([self.get_state(entity, copy=False) == "on" for entity in self.lights]):
+        if "on" in self._light_states().values():
             self.sensor_state = "on"
             if len(self._switched_on_by_automoli) > 0:
-                self.sensor_attr["times_turned_on_by_automoli"] = 1
-                self.sensor_attr.pop("times_turned_on_manually", 0)
-                self.sensor_attr.pop("times_turned_on_by_automations", 0)
+                sensor_attr["times_turned_on_by_automoli"] = 1
+                self._drop_stats(
+                    "times_turned_on_manually", "times_turned_on_by_automations"
+                )
             else:
-                self.sensor_attr.pop("times_turned_on_by_automoli", 0)
-                self.sensor_attr["times_turned_on_manually"] = 1
-                self.sensor_attr.pop("times_turned_on_by_automations", 0)
+                sensor_attr["times_turned_on_manually"] = 1
+                self._drop_stats(
+                    "times_turned_on_by_automoli", "times_turned_on_by_automations"
+                )
         else:
             self.sensor_state = "off"
-            self.sensor_attr.pop("times_turned_on_by_automoli", 0)
-            self.sensor_attr.pop("times_turned_on_by_automations", 0)
-            self.sensor_attr.pop("times_turned_on_manually", 0)
+            self._drop_stats(
+                "times_turned_on_by_automoli",
+                "times_turned_on_by_automations",
+                "times_turned_on_manually",
+            )
 
-        self.sensor_attr.pop("times_turned_off_by_automoli", 0)
-        self.sensor_attr.pop("times_turned_off_by_automations", 0)
-        self.sensor_attr.pop("times_turned_off_manually", 0)
+        self._drop_stats(
+            "times_turned_off_by_automoli",
+            "times_turned_off_by_automations",
+            "times_turned_off_manually",
+        )
 
-        if self.track_room_stats:
-            self.set_state(
-                entity_id=self.entity_id,
-                state=self.sensor_state,
-                attributes=self.sensor_attr,
-                replace=True,
-            )
+        self.write_room_stats()
 
     def update_room_stats(self, kwargs: dict[str, Any] | None = None):
-        howChanged = kwargs.get("howChanged", "automoli")
         stat = kwargs.get("stat", None)
-        currentTime = datetime.now()
-        currentTimeStr = currentTime.strftime(DATETIME_FORMAT)
 
         # stat will be a dictionary if update_room_stats is called from run_in
         if isinstance(stat, dict):
             stat = dict(stat).get("stat", "")
 
-        if stat == "motion":
-            self.sensor_attr["last_motion_detected"] = currentTimeStr
-            self.sensor_attr["last_motion_by"] = self.get_name(kwargs.get("entity"))
-            self.sensor_attr.pop("last_motion_cleared", "")
-            self.sensor_attr["turning_off_at"] = "Waiting for motion to clear"
-
-        elif stat == "motion_cleared":
-            self.sensor_attr["last_motion_cleared"] = currentTimeStr
-            self.sensor_attr["last_motion_by"] = self.get_name(kwargs.get("entity"))
-            self.sensor_attr.pop("last_motion_detected", "")
-            # Clearing "Waiting for motion to clear" before refresh timer call
-            # sets real turning_off_at time
-            self.sensor_attr.pop("turning_off_at", "")
-
-        elif stat == "lastOn":
-            self.sensor_state = "on"
-
-            self.sensor_attr["last_turned_on"] = currentTimeStr
-            countAutomoliOn = self.sensor_attr.get("times_turned_on_by_automoli", 0)
-            countAutomationOn = self.sensor_attr.get(
-                "times_turned_on_by_automations", 0
-            )
-            countManualOn = self.sensor_attr.get("times_turned_on_manually", 0)
-            if howChanged == "automoli":
-                # do not update automoli count on reboot unless nothing has been counted
-                # then assume automoli turned it on
-                if not kwargs.get("appInit", False) or (
-                    countAutomoliOn + countAutomationOn + countManualOn == 0
-                ):
-                    self.sensor_attr["times_turned_on_by_automoli"] = (
-                        countAutomoliOn + 1
-                    )
-            elif howChanged == "automation":
-                self.sensor_attr["times_turned_on_by_automations"] = (
-                    countAutomationOn + 1
-                )
-                self.sensor_attr.pop("last_motion_detected", "")
-                self.sensor_attr.pop("last_motion_cleared", "")
-                self.sensor_attr.pop("last_motion_by", "")
-            elif howChanged == "manually":
-                self.sensor_attr["times_turned_on_manually"] = countManualOn + 1
-                self.sensor_attr.pop("last_motion_detected", "")
-                self.sensor_attr.pop("last_motion_cleared", "")
-                self.sensor_attr.pop("last_motion_by", "")
-            source = kwargs.get("source", "<unknown>")
-            self.sensor_attr["last_turned_on_by"] = source
-            self.sensor_attr.pop("delay_overridden_by", "")
-            self.sensor_attr.pop("blocked_on_by", "")
-            self.sensor_attr.pop("disabled_by", "")
-
-            # Update onToday again every minute until light is off
-            self.sensor_update_handle = self.run_every(
-                self.update_room_stats, "now+60", 60, stat="updateEveryMin"
-            )
-
-        elif stat == "lastOff":
-            self.sensor_state = "off"
-
-            self.sensor_attr["last_turned_off"] = currentTimeStr
-            self.sensor_onToday = int(self.sensor_onToday) + int(self.time_lights_on())
-            self.sensor_attr["time_lights_on_today"] = self.seconds_to_time(
-                self.sensor_onToday
-            )
-            if howChanged == "automoli":
-                # do not update automoli count on reboot
-                if not kwargs.get("appInit", False):
-                    countAutomoliOff = self.sensor_attr.get(
-                        "times_turned_off_by_automoli", 0
-                    )
-                    self.sensor_attr["times_turned_off_by_automoli"] = (
-                        countAutomoliOff + 1
-                    )
-            elif howChanged == "automation":
-                countAutomationOff = self.sensor_attr.get(
-                    "times_turned_off_by_automations", 0
-                )
-                self.sensor_attr["times_turned_off_by_automations"] = (
-                    countAutomationOff + 1
-                )
-            elif howChanged == "manually":
-                countManualOff = self.sensor_attr.get("times_turned_off_manually", 0)
-                self.sensor_attr["times_turned_off_manually"] = countManualOff + 1
-            source = kwargs.get("source", "<unknown>")
-            self.sensor_attr["last_turned_off_by"] = source
-            self.sensor_attr.pop("turning_off_at", "")
-            self.sensor_attr.pop("blocked_off_by", "")
-            self.sensor_attr.pop("disabled_by", "")
-
-        elif stat == "overrideDelay":
-            if kwargs.get("enable"):
-                self.sensor_attr["delay_overridden_by"] = self.get_name(
-                    kwargs.get("entity")
-                )
-            else:
-                self.sensor_attr.pop("delay_overridden_by", "")
-
-        elif stat == "refreshTimer":
-            if self.sensor_state == "on":
-                self.sensor_attr["turning_off_at"] = datetime.strftime(
-                    kwargs.get("time"), DATETIME_FORMAT
-                )
-            else:
-                self.sensor_attr.pop("turning_off_at", "")
-
-        elif stat == "switchDaytime":
-            light_setting = (
-                self.active.get("light_setting")
-                if not self.night_mode_active()
-                else self.night_mode.get("light")
-            )
-            current_light_setting = str(light_setting)
-            if isinstance(light_setting, int):
-                current_light_setting = current_light_setting + "%"
-            self.sensor_attr["current_light_setting"] = current_light_setting
-
-        elif stat == "blockedOn":
-            self.sensor_attr["blocked_on_by"] = self.get_name(kwargs.get("entity"))
+        # a scheduled blocker update is no longer pending once it runs
+        self._stats_handles.pop(stat, None)
 
-        elif stat == "blockedOff":
-            self.sensor_attr["blocked_off_by"] = self.get_name(kwargs.get("entity"))
-
-        elif stat == "disabled":
-            if self.entity_exists(entity := kwargs.get("entity")):
-                self.sensor_attr["disabled_by"] = self.get_name(entity)
-            else:
-                self.sensor_attr["disabled_by"] = entity
-
-        elif stat == "onlyOwnEventsBlock":
-            self.sensor_attr["blocked_off_by"] = "Manually turned on"
+        if handler := self._stat_handlers.get(stat):
+            handler(kwargs)
 
         # If the room is still on, record all the time it was on until now
-        adjustedOnToday = int(self.sensor_onToday)
+        adjustedOnToday = self.sensor_onToday
         if self.sensor_state == "on":
-            adjustedOnToday += int(self.time_lights_on())
+            adjustedOnToday += self.time_lights_on()
             self.sensor_attr["time_lights_on_today"] = self.seconds_to_time(
                 adjustedOnToday
             )
@@ -2379,45 +2355,161 @@ class AutoMoLi(hass.Hass):  # type: ignore
             if self.timer_running(self.sensor_update_handle):
                 self.cancel_timer(self.sensor_update_handle)
 
-        if logging.DEBUG >= self.loglevel:
+        # debug_message is only consumed when the stats entity is written
+        if self.track_room_stats and logging.DEBUG >= self.loglevel:
+            now = datetime.now()
             debug_message = (
-                f"{stat} | now: {datetime.now().strftime('%H:%M:%S.%f')}"
+                f"{stat} | now: {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+                f".{now.microsecond:06d}"
                 f" | time on today: {self.seconds_to_time(adjustedOnToday)} | { kwargs.get('message', '')}"
             )
             self.sensor_attr["debug_message"] = debug_message
 
-        if self.track_room_stats:
-            self.set_state(
-                entity_id=self.entity_id,
-                state=self.sensor_state,
-                attributes=self.sensor_attr,
-                replace=True,
+        self.write_room_stats()
+
+        if logging.DEBUG >= self.loglevel:
+            self.lg(
+                f"update_room_stats: called by '{stat}' and updated state to {self.sensor_attr}",
+                level=logging.DEBUG,
             )
 
-        self.lg(
-            f"{stack()[0][3]}: called by '{stat}' and updated state to {self.sensor_attr}",
-            level=logging.DEBUG,
+    def _drop_stats(self, *keys: str) -> None:
+        """remove the given attributes from the room stats, if present"""
+        sensor_attr = self.sensor_attr
+        for key in keys:
+            sensor_attr.pop(key, None)
+
+    def _stat_motion(self, kwargs: dict[str, Any]) -> None:
+        sensor_attr = self.sensor_attr
+        currentTimeStr = datetime.now().strftime(DATETIME_FORMAT)
+        sensor_attr["last_motion_detected"] = currentTimeStr
+        sensor_attr["last_motion_by"] = self.get_name(kwargs.get("entity"))
+        sensor_attr.pop("last_motion_cleared", None)
+        sensor_attr["turning_off_at"] = "Waiting for motion to clear"
+
+    def _stat_motion_cleared(self, kwargs: dict[str, Any]) -> None:
+        sensor_attr = self.sensor_attr
+        currentTimeStr = datetime.now().strftime(DATETIME_FORMAT)
+        sensor_attr["last_motion_cleared"] = currentTimeStr
+        sensor_attr["last_motion_by"] = self.get_name(kwargs.get("entity"))
+        sensor_attr.pop("last_motion_detected", None)
+        # Clearing "Waiting for motion to clear" before refresh timer call
+        # sets real turning_off_at time
+        sensor_attr.pop("turning_off_at", None)
+
+    def _stat_last_on(self, kwargs: dict[str, Any]) -> None:
+        sensor_attr = self.sensor_attr
+        self._last_turned_on = datetime.now().replace(microsecond=0)
+        howChanged = kwargs.get("howChanged", "automoli")
+        self.sensor_state = "on"
+
+        sensor_attr["last_turned_on"] = self._last_turned_on.strftime(DATETIME_FORMAT)
+        countAutomoliOn = sensor_attr.get("times_turned_on_by_automoli", 0)
+        countAutomationOn = sensor_attr.get("times_turned_on_by_automations", 0)
+        countManualOn = sensor_attr.get("times_turned_on_manually", 0)
+        if howChanged == "automoli":
+            # do not update automoli count on reboot unless nothing has been counted
+            # then assume automoli turned it on
+            if not kwargs.get("appInit", False) or (
+                countAutomoliOn + countAutomationOn + countManualOn == 0
+            ):
+                sensor_attr["times_turned_on_by_automoli"] = countAutomoliOn + 1
+        elif howChanged == "automation":
+            sensor_attr["times_turned_on_by_automations"] = countAutomationOn + 1
+            self._drop_stats(*MOTION_ATTRS)
+        elif howChanged == "manually":
+            sensor_attr["times_turned_on_manually"] = countManualOn + 1
+            self._drop_stats(*MOTION_ATTRS)
+        source = kwargs.get("source", "<unknown>")
+        sensor_attr["last_turned_on_by"] = source
+        self._drop_stats("delay_overridden_by", "blocked_on_by", "disabled_by")
+
+        # Update onToday again every minute until light is off
+        self.sensor_update_handle = self.run_every(
+            self.update_room_stats, "now+60", 60, stat="updateEveryMin"
         )
 
+    def _stat_last_off(self, kwargs: dict[str, Any]) -> None:
+        sensor_attr = self.sensor_attr
+        currentTimeStr = datetime.now().strftime(DATETIME_FORMAT)
+        howChanged = kwargs.get("howChanged", "automoli")
+        self.sensor_state = "off"
+
+        sensor_attr["last_turned_off"] = currentTimeStr
+        self.sensor_onToday += self.time_lights_on()
+        sensor_attr["time_lights_on_today"] = self.seconds_to_time(self.sensor_onToday)
+        if howChanged == "automoli":
+            # do not update automoli count on reboot
+            if not kwargs.get("appInit", False):
+                countAutomoliOff = sensor_attr.get("times_turned_off_by_automoli", 0)
+                sensor_attr["times_turned_off_by_automoli"] = countAutomoliOff + 1
+        elif howChanged == "automation":
+            countAutomationOff = sensor_attr.get("times_turned_off_by_automations", 0)
+            sensor_attr["times_turned_off_by_automations"] = countAutomationOff + 1
+        elif howChanged == "manually":
+            countManualOff = sensor_attr.get("times_turned_off_manually", 0)
+            sensor_attr["times_turned_off_manually"] = countManualOff + 1
+        source = kwargs.get("source", "<unknown>")
+        sensor_attr["last_turned_off_by"] = source
+        self._drop_stats("turning_off_at", "blocked_off_by", "disabled_by")
+
+    def _stat_override_delay(self, kwargs: dict[str, Any]) -> None:
+        if kwargs.get("enable"):
+            self.sensor_attr["delay_overridden_by"] = self.get_name(
+                kwargs.get("entity")
+            )
+        else:
+            self.sensor_attr.pop("delay_overridden_by", None)
+
+    def _stat_refresh_timer(self, kwargs: dict[str, Any]) -> None:
+        if self.sensor_state == "on":
+            self.sensor_attr["turning_off_at"] = datetime.strftime(
+                kwargs.get("time"), DATETIME_FORMAT
+            )
+        else:
+            self.sensor_attr.pop("turning_off_at", None)
+
+    def _stat_switch_daytime(self, kwargs: dict[str, Any]) -> None:
+        light_setting = (
+            self.active.get("light_setting")
+            if not self.night_mode_active()
+            else self.night_mode.get("light")
+        )
+        current_light_setting = str(light_setting)
+        if isinstance(light_setting, int):
+            current_light_setting = current_light_setting + "%"
+        self.sensor_attr["current_light_setting"] = current_light_setting
+
+    def _stat_blocked_on(self, kwargs: dict[str, Any]) -> None:
+        self.sensor_attr["blocked_on_by"] = self.get_name(kwargs.get("entity"))
+
+    def _stat_blocked_off(self, kwargs: dict[str, Any]) -> None:
+        self.sensor_attr["blocked_off_by"] = self.get_name(kwargs.get("entity"))
+
+    def _stat_disabled(self, kwargs: dict[str, Any]) -> None:
+        self.sensor_attr["disabled_by"] = self.get_name(kwargs.get("entity"))
+
+    def _stat_only_own_events_block(self, kwargs: dict[str, Any]) -> None:
+        self.sensor_attr["blocked_off_by"] = "Manually turned on"
+
     # Global lock ensures that multiple log writes occur together when printing room stats
     @ad.global_lock
     def print_room_stats(self, kwargs: dict[str, Any] | None = None) -> None:
+        # nothing to print if the room has not been on today
+        if self.sensor_state != "on" and self.sensor_onToday == 0:
+            return
+
         currentTime = datetime.now()
-        adjustedOnToday = int(self.sensor_onToday)
+        adjustedOnToday = self.sensor_onToday
 
         if self.sensor_state == "on":
             # The room is still on, record all the time it was on until now
-            lastOn = currentTime
-            lastTurnedOn = self.sensor_attr.get("last_turned_on", "")
-            if lastTurnedOn != "":
-                lastOn = datetime.strptime(
-                    self.sensor_attr["last_turned_on"], DATETIME_FORMAT
-                )
+            lastOn = self._last_turned_on or currentTime
             adjustedOnToday = adjustedOnToday + (
-                int(datetime.timestamp(currentTime)) - int(datetime.timestamp(lastOn))
+                int(currentTime.timestamp()) - int(lastOn.timestamp())
             )
 
-        if int(adjustedOnToday) != 0:
+        if adjustedOnToday != 0:
             # Print out the current stats
             automoliOn = self.sensor_attr.get("times_turned_on_by_automoli", 0)
             automationOn = self.sensor_attr.get("times_turned_on_by_automations", 0)
@@ -2426,7 +2518,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
             manualOff = self.sensor_attr.get("times_turned_off_manually", 0)
             totalOn = automoliOn + automationOn + manualOn
             self.lg(
-                f"{hl(self.room_name.replace('_',' ').title())} was turned on "
+                f"{self._room_pretty_hl} was turned on "
                 f"{totalOn} time(s) for a total of {self.seconds_to_time(adjustedOnToday)} today"
             )
             if automationOn > 0 or manualOn > 0:
@@ -2440,9 +2532,7 @@ class AutoMoLi(hass.Hass):  # type: ignore
                 if manualOn > 0:
                     message = message + f"manually {manualOn} time(s)"
 
-                self.lg(
-                    f"{hl(self.room_name.replace('_',' ').title())} was turned on {message}"
-                )
+                self.lg(f"{self._room_pretty_hl} was turned on {message}")
             if automationOff > 0 or manualOff > 0:
                 message = ""
                 if automationOff > 0:
@@ -2453,49 +2543,41 @@ class AutoMoLi(hass.Hass):  # type: ignore
                     )
                 if manualOff > 0:
                     message = message + f"manually {manualOff} time(s)"
-                self.lg(
-                    f"{hl(self.room_name.replace('_',' ').title())} was turned off {message}"
-                )
+                self.lg(f"{self._room_pretty_hl} was turned off {message}")
 
     def time_lights_on(self) -> int:
         # returns number of seconds the room has been on
         # since turned on or since midnight, whichever came last
 
         currentTime = datetime.now()
-        # Python community recommend a strategy of
-        # "easier to ask for forgiveness than permission"
-        # https://stackoverflow.com/a/610923/13180763
-        try:
-            lastOn = datetime.strptime(
-                self.sensor_attr["last_turned_on"], DATETIME_FORMAT
-            )
-        except KeyError:
+        if (lastOn := self._last_turned_on) is None:
             lastOn = currentTime
-            self.lg(
-                f"{stack()[0][3]}: the lights have not yet been turned on",
-                level=logging.DEBUG,
-            )
+            if logging.DEBUG >= self.loglevel:
+                self.lg(
+                    "time_lights_on: the lights have not yet been turned on",
+                    level=logging.DEBUG,
+                )
 
         # If last_turned_on was yesterday, record from midnight
-        today = date.today()
-        lastOnDate = date(lastOn.year, lastOn.month, lastOn.day)
-        if today != lastOnDate:
-            lastOn = datetime(today.year, today.month, today.day, 0, 0, 0)
+        # (taking today from currentTime so the clock is only read once)
+        today = currentTime.date()
+        if lastOn.date() != today:
+            lastOn = datetime.combine(today, time())
+
+        return int(currentTime.timestamp()) - int(lastOn.timestamp())
 
-        return int(datetime.timestamp(currentTime)) - int(datetime.timestamp(lastOn))
+    def time_to_seconds(self, time_str: str) -> int:
+        """convert a HH:MM:SS string as written by seconds_to_time back to seconds"""
+        hours, minutes, seconds = time_str.split(":")
+        return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
 
     def seconds_to_time(self, total, includeDays=False):
-        if includeDays:
-            days = int(total // (24 * 3600))
-        total %= 24 * 3600
-        hours = int(total // 3600)
-        total %= 3600
-        minutes = int(total // 60)
-        total %= 60
-        seconds = int(total)
-        if (includeDays == False) or (days == 0):
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        elif days == 1:
-            return f"{days} day, {hours:02d}:{minutes:02d}:{seconds:02d}"
-        elif days > 1:
-            return f"{days} days, {hours:02d}:{minutes:02d}:{seconds:02d}"
+        if not total:
+            return ZERO_TIME
+        days, total = divmod(int(total), 24 * 3600)
+        hours, total = divmod(total, 3600)
+        minutes, seconds = divmod(total, 60)
+        hms = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        if not includeDays or days == 0:
+            return hms
+        return f"{days} day{'s' if days > 1 else ''}, {hms}"